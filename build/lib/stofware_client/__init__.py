@@ -1,3 +0,0 @@
-from client import StofwareClient
-
-__version__ = "0.1."
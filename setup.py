@@ -10,10 +10,14 @@ setup(
     long_description_content_type='text/markdown',
     url="https://github.com/stofloos/stofware-python-client-sdk",  
     license="MIT",
-    packages=find_packages(),
+    packages=find_packages(exclude=["build", "build.*", "tests", "tests.*"]),
     install_requires=[
         "requests>=2.0.0",  # Required dependencies
     ],
+    extras_require={
+        "async": ["httpx[http2]>=0.23.0"],
+        "speedups": ["orjson>=3.0.0"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
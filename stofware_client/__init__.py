@@ -1,3 +1,4 @@
 from .client import StofwareClient
+from .async_client import AsyncStofwareClient
 
 __version__ = "0.1.2"
@@ -0,0 +1,195 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union, List, Dict
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+from .client import (
+    ApiModelQuery, ApiViewQuery, _loads, _prepare_request, _RETRY_BACKOFF, _RETRY_STATUSES, _RETRY_TOTAL
+)
+
+
+class AsyncStofwareClient:
+    """
+    Asynchronous counterpart of StofwareClient, built on httpx.AsyncClient.
+
+    Independent queries can be issued concurrently:
+
+        async with AsyncStofwareClient("https://api.example.com", "token") as client:
+            results = await asyncio.gather(
+                *[client.model(name).filter("id", "GT", 0).get_all() for name in names]
+            )
+    """
+
+    __slots__ = ("base_url", "token", "_auth_header", "_client")
+
+    def __init__(self, base_url: str, token: Optional[str] = None):
+        if httpx is None:
+            raise ImportError("AsyncStofwareClient requires httpx: pip install 'stofware-client-sdk[async]'")
+
+        self.base_url = base_url
+        self.token = token
+        self._auth_header = f"Bearer {token}" if token else None
+
+        headers = {"Content-Type": "application/json"}
+        if self._auth_header is not None:
+            headers["Authorization"] = self._auth_header
+
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying httpx client and releases its pooled connections.
+        """
+        await self._client.aclose()
+
+    def model(self, entity: str):
+        return AsyncApiModelQuery(self, entity)
+
+    def view(self, view_name: str):
+        return AsyncApiViewQuery(self, view_name)
+
+    def set_token(self, token: Optional[str]):
+        """
+        Sets the bearer token sent with every request, or stops sending one when token is None.
+        """
+        self.token = token
+        self._auth_header = f"Bearer {token}" if token else None
+        if self._auth_header is not None:
+            self._client.headers["Authorization"] = self._auth_header
+        else:
+            self._client.headers.pop("Authorization", None)
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Union[Dict, str]] = None,
+        data: Optional[Union[Dict, str]] = None,
+        query: Optional[str] = None) -> Awaitable[Dict]:
+        """
+        Prepares an HTTP request to the specified endpoint and returns an awaitable
+        that sends it.
+
+        Accepts and validates arguments the same way as StofwareClient._request, and
+        retries 502/503/504 responses with the same policy.
+
+        Params and data are encoded before returning, so changes made to a query after
+        calling a terminal method don't affect the request that is awaited later.
+
+        Raises:
+            ValueError: If params or data are invalid JSON strings.
+            TypeError: If params or data are not dicts or JSON strings.
+            Exception: For non-OK HTTP responses, when awaited.
+        """
+        query, body = _prepare_request(params, data, query)
+        return self._send(method, endpoint, query, body)
+
+    async def _send(self, method: str, endpoint: str, query: Optional[str], body: Optional[bytes]) -> Dict:
+        # Same retry policy as the sync client's HTTPAdapter, which doesn't retry POST
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = await self._client.request(
+                method,
+                endpoint,
+                params=query,
+                content=body
+            )
+            if response.status_code not in _RETRY_STATUSES or method == "POST" or attempt == _RETRY_TOTAL:
+                break
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            raise Exception(f"{response.status_code}: {response.text}") from None
+
+        try:
+            return _loads(response.content)
+        except json.JSONDecodeError:
+            raise ValueError("Response content is not valid JSON")
+
+
+async def _empty_result() -> List:
+    return []
+
+
+class AsyncApiModelQuery(ApiModelQuery):
+    """
+    ApiModelQuery whose terminal methods (get_all, get_single, aggregate, post, ...)
+    return awaitables. The request is prepared from the query's current params when
+    the method is called.
+    """
+
+    __slots__ = ()
+
+    def get_many(self, ids: List[Union[int, str]], select: Optional[List[str]] = None, page_limit: Optional[int] = None):
+        # Calling with no ids still has to return an awaitable
+        ids = list(ids)
+        if not ids:
+            return _empty_result()
+        return super().get_many(ids, select, page_limit)
+
+    async def get_many_concurrent(self, ids: List[Union[int, str]], chunk_size: int = 500, max_concurrency: int = 8):
+        """
+        Splits ids into chunks and fetches them concurrently with get_many,
+        with at most max_concurrency requests in flight.
+
+        Returns:
+            List: One get_many response per chunk, in the order of ids.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(query):
+            async with semaphore:
+                return await query
+
+        return await asyncio.gather(*[fetch(self.get_many(chunk)) for chunk in self._chunk_ids(ids, chunk_size)])
+
+    async def iter_pages(self, concurrency: int = 8, is_last_page: Optional[Callable[[Any], bool]] = None) -> AsyncIterator[Any]:
+        """
+        Async counterpart of ApiModelQuery.iter_pages, fetching each wave of pages
+        with asyncio.gather.
+        """
+        fetch = self._page_fetcher()
+
+        num = self.params.get('page', 1)
+        page = await fetch(num)
+        is_last_page = self._last_page_predicate(page, is_last_page)
+        if not page:
+            return
+        yield page
+        if is_last_page(page):
+            return
+
+        while True:
+            wave = range(num + 1, num + 1 + concurrency)
+            for page in await asyncio.gather(*[fetch(n) for n in wave]):
+                if not page:
+                    return
+                yield page
+                if is_last_page(page):
+                    return
+            num = wave[-1]
+
+
+class AsyncApiViewQuery(ApiViewQuery):
+    """
+    ApiViewQuery whose terminal methods (get_all, aggregate) return awaitables.
+    """
+
+    __slots__ = ()
@@ -1,6 +1,47 @@
 import json
+import threading
+import time
 import requests
-from typing import Optional, Union, List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
+from typing import Optional, Union, List, Dict, Any, Callable, Iterator, Tuple
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency
+    httpx = None
+
+try:
+    import orjson
+
+    def _encode(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encodes fine
+            return json.dumps(obj).encode()
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:  # orjson is an optional dependency, fall back to the stdlib
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Retry policy for 502/503/504 responses, shared by both clients
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = (502, 503, 504)
 
 # Types for better readability
 QueryOrder = Union["ASC", "DESC", "asc", "desc"]
@@ -9,10 +50,204 @@ AggregateFunction = Union["mean", "median", "mode", "sum", "count", "countdistin
 QueryParametersFilterValue = Union[str, bool, int, List[int], List[str]]
 BooleanOperator = Union["AND", "OR"]
 
+def _serialize_params(params: Dict) -> Dict:
+    """
+    JSON-encodes list and dict values of query parameters, which would otherwise be
+    sent as repeated keys (or lose their values altogether). The dict is only copied
+    when such values are present.
+    """
+    if any(isinstance(v, (list, dict)) for v in params.values()):
+        return {k: (_dumps(v) if isinstance(v, (list, dict)) else v) for k, v in params.items()}
+    return params
+
+
+def _encode_query(params: Dict) -> str:
+    """
+    URL-encodes query parameters, with list and dict values as JSON. None values are dropped.
+    """
+    return urlencode([(k, v) for k, v in _serialize_params(params).items() if v is not None], doseq=True)
+
+
+def _process_input(input_data: Optional[Union[Dict, str]], name: str) -> Optional[Union[Dict, str]]:
+    """
+    Processes input data for params or data by ensuring it's a dict or a valid JSON string.
+
+    Args:
+        input_data (Optional[Union[Dict, str]]): The input data to process.
+        name (str): Name of the parameter ('params' or 'data') for error messages.
+
+    Returns:
+        Optional[Union[Dict, str]]: Processed input data.
+
+    Raises:
+        ValueError: If input_data is a string but not valid JSON.
+        TypeError: If input_data is neither a dict nor a string.
+    """
+    if input_data is None:
+        return None
+
+    if isinstance(input_data, str):
+        try:
+            parsed = _loads(input_data)
+            if not isinstance(parsed, dict):
+                raise ValueError(f"The JSON string for {name} must represent an object/dictionary.")
+            return parsed
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON string for {name}: {e}") from e
+
+    elif isinstance(input_data, dict):
+        return input_data
+
+    else:
+        raise TypeError(f"{name} must be a dict or a JSON-formatted string")
+
+
+def _prepare_request(
+    params: Optional[Union[Dict, str]],
+    data: Optional[Union[Dict, str]],
+    query: Optional[str] = None) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Validates params and data and encodes them into the query string and body
+    sent by both clients. An already encoded query string is used as-is.
+
+    Raises:
+        ValueError: If params or data are invalid JSON strings.
+        TypeError: If params or data are not dicts or JSON strings.
+    """
+    if query is None:
+        processed_params = _process_input(params, "params")
+        query = _encode_query(processed_params) if processed_params is not None else None
+
+    # Serialized once here so the transport doesn't re-encode it
+    processed_data = _process_input(data, "data")
+    body = _encode(processed_data) if processed_data is not None else None
+
+    return query, body
+
+
+class _ETagCache:
+    """
+    Small LRU of GET response bodies with their ETag, used to send conditional
+    requests (If-None-Match) so unchanged resources come back as 304 Not Modified.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, etag: str, content: bytes):
+        with self._lock:
+            self._entries[key] = (etag, content)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
 class StofwareClient:
-    def __init__(self, base_url: str, token: Optional[str] = None):
+    __slots__ = (
+        "base_url", "token", "_auth_header", "_base_url", "_session", "_http", "_etag_cache"
+    )
+
+    def __init__(self, base_url: str, token: Optional[str] = None, transport: str = "requests", etag_cache_size: int = 0,
+                 pool_maxsize: int = 20):
+        """
+        Args:
+            base_url (str): Base URL of the Stofware API.
+            token (Optional[str]): Bearer token used for authorization.
+            transport (str): "requests" (default) or "httpx". The httpx transport
+                speaks HTTP/2, so concurrent calls are multiplexed over a single connection.
+            etag_cache_size (int): Number of GET responses kept, bodies included, for
+                conditional requests (If-None-Match). Disabled (0) by default.
+            pool_maxsize (int): Connections kept per host, this bounds how many
+                threads can share the session without opening throwaway connections.
+        """
         self.base_url = base_url
         self.token = token
+        self._auth_header = f"Bearer {token}" if token else None
+        self._base_url = base_url.rstrip('/')
+
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport: {transport}")
+
+        self._http = None
+        if transport == "httpx":
+            if httpx is None:
+                raise ImportError("The httpx transport requires httpx: pip install 'stofware-client-sdk[async]'")
+            headers = {"Content-Type": "application/json"}
+            if self._auth_header is not None:
+                headers["Authorization"] = self._auth_header
+            # Connection errors are retried by the transport, 502/503/504 responses in _request
+            self._http = httpx.Client(
+                base_url=base_url,
+                headers=headers,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=_RETRY_TOTAL,
+                    limits=httpx.Limits(max_keepalive_connections=pool_maxsize, max_connections=max(100, pool_maxsize))
+                )
+            )
+
+        # A persistent session keeps connections alive between API calls
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        if self._auth_header is not None:
+            self._session.headers["Authorization"] = self._auth_header
+
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            # raise_on_status=False hands the last response to the status check in _request
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._etag_cache = _ETagCache(etag_cache_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying session and releases its pooled connections.
+        """
+        self._session.close()
+        if self._http is not None:
+            self._http.close()
+
+    def map(self, callables: List[Callable[[], Any]], max_workers: int = 8) -> List[Any]:
+        """
+        Runs independent queries in parallel threads over the shared session, the
+        recommended way to fan out requests from synchronous code:
+
+            users, orders = client.map([
+                lambda: client.model("users").get_all(),
+                lambda: client.model("orders").get_all(),
+            ])
+
+        Keep max_workers at or below the client's pool_maxsize.
+
+        Returns:
+            List[Any]: The results of the callables, in the same order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda f: f(), callables))
 
     def model(self, entity: str):
         return ApiModelQuery(self, entity)
@@ -20,24 +255,37 @@ class StofwareClient:
     def view(self, view_name: str):
         return ApiViewQuery(self, view_name)
 
-    def set_token(self, token: str):
+    def set_token(self, token: Optional[str]):
+        """
+        Sets the bearer token sent with every request, or stops sending one when token is None.
+        """
         self.token = token
+        self._auth_header = f"Bearer {token}" if token else None
+        headers = [self._session.headers]
+        if self._http is not None:
+            headers.append(self._http.headers)
+        for h in headers:
+            if self._auth_header is not None:
+                h["Authorization"] = self._auth_header
+            else:
+                h.pop("Authorization", None)
 
-   
     def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Union[Dict, str]] = None,
-        data: Optional[Union[Dict, str]] = None) -> Dict:
+        data: Optional[Union[Dict, str]] = None,
+        query: Optional[str] = None) -> Dict:
         """
         Makes an HTTP request to the specified endpoint with given parameters and data.
 
         Args:
-            method (str): HTTP method (GET, POST, etc.).
-            endpoint (str): API endpoint (relative to base_url).
+            method (str): HTTP method in uppercase (GET, POST, etc.).
+            endpoint (str): API endpoint relative to base_url, without a leading slash.
             params (Optional[Union[Dict, str]]): Query parameters as dict or JSON string.
             data (Optional[Union[Dict, str]]): Request body as dict or JSON string.
+            query (Optional[str]): Already URL-encoded query string, sent instead of params.
 
         Returns:
             Dict: Parsed JSON response from the API.
@@ -47,120 +295,127 @@ class StofwareClient:
             TypeError: If params or data are not dicts or JSON strings.
             Exception: For non-OK HTTP responses.
         """
-        
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"  # Ensure single slash
-
-        # Handle params
-        processed_params = self._process_input(params, "params")
-
-        # Handle data
-        processed_data = self._process_input(data, "data")
-
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            params=processed_params,
-            json=processed_data
-        )
+        query, body = _prepare_request(params, data, query)
+
+        # Revalidate previously fetched GET responses instead of downloading them again
+        cache_key = cached = headers = None
+        if method == "GET" and self._etag_cache.maxsize > 0:
+            cache_key = (endpoint, query, self.token)
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
+
+        if self._http is not None:
+            # Same retry policy as the requests HTTPAdapter, which doesn't retry POST
+            for attempt in range(_RETRY_TOTAL + 1):
+                response = self._http.request(
+                    method,
+                    endpoint,
+                    params=query,
+                    content=body,
+                    headers=headers
+                )
+                if response.status_code not in _RETRY_STATUSES or method == "POST" or attempt == _RETRY_TOTAL:
+                    break
+                time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+            status_error = httpx.HTTPStatusError
+        else:
+            response = self._session.request(
+                method,
+                self._base_url + "/" + endpoint,
+                params=query,
+                data=body,
+                headers=headers,
+                stream=False
+            )
+            # The API always answers in UTF-8, skip charset detection on .text
+            response.encoding = "utf-8"
+            status_error = requests.HTTPError
+
+        if cached is not None and response.status_code == 304:
+            return _loads(cached[1])
 
-        if not response.ok:
-            raise Exception(f"{response.status_code}: {response.text}")
+        try:
+            response.raise_for_status()
+        except status_error:
+            raise Exception(f"{response.status_code}: {response.text}") from None
 
         try:
-            return response.json()
+            result = _loads(response.content)
         except json.JSONDecodeError:
             raise ValueError("Response content is not valid JSON")
-    
-    def _process_input(self, input_data: Optional[Union[Dict, str]], name: str) -> Optional[Union[Dict, str]]:
-        """
-        Processes input data for params or data by ensuring it's a dict or a valid JSON string.
 
-        Args:
-            input_data (Optional[Union[Dict, str]]): The input data to process.
-            name (str): Name of the parameter ('params' or 'data') for error messages.
-
-        Returns:
-            Optional[Union[Dict, str]]: Processed input data.
-
-        Raises:
-            ValueError: If input_data is a string but not valid JSON.
-            TypeError: If input_data is neither a dict nor a string.
-        """
-        if input_data is None:
-            return None
-
-        if isinstance(input_data, str):
-            try:
-                parsed = json.loads(input_data)
-                if not isinstance(parsed, dict):
-                    raise ValueError(f"The JSON string for {name} must represent an object/dictionary.")
-                return parsed
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON string for {name}: {e}") from e
-
-        elif isinstance(input_data, dict):
-            return input_data
-
-        else:
-            raise TypeError(f"{name} must be a dict or a JSON-formatted string")
+        etag = response.headers.get("ETag") if cache_key is not None else None
+        if etag:
+            self._etag_cache.put(cache_key, etag, response.content)
+        return result
 
 
 class ApiBaseQuery:
+    __slots__ = ("client", "params")
+
     def __init__(self, client: StofwareClient):
         self.client = client
         self.params: Dict[str, Any] = {}
 
     def filter(self, name: str, operator: QueryOperator, value: QueryParametersFilterValue):
-        if 'filters' not in self.params:
-            self.params['filters'] = []
-        self.params['filters'].append({"name": name, "operator": operator, "value": value})
+        self.params.setdefault('filters', []).append({"name": name, "operator": operator, "value": value})
         return self
 
     def append_filter(self, name: str, operator: QueryOperator, value: QueryParametersFilterValue, boolean_operator: BooleanOperator = "AND"):
-        if 'filter' not in self.params:
-            self.params['filter'] = {"operator": boolean_operator, "items": [{"name": name, "operator": operator, "value": value}]}
+        """
+        Adds a condition to the 'filter' group. Conditions appended with the group's
+        boolean_operator join its items; a different boolean_operator nests the current
+        group as the first item of a new one, e.g. (a AND b) OR c is sent as
+        {"operator": "OR", "items": [{"operator": "AND", "items": [a, b]}, c]}.
+        """
+        item = {"name": name, "operator": operator, "value": value}
+        group = self.params.get('filter')
+        if group is None:
+            self.params['filter'] = {"operator": boolean_operator, "items": [item]}
+        elif group['operator'] == boolean_operator:
+            group['items'].append(item)
         else:
-            if self.params['filter']['operator'] == boolean_operator:
-                self.params['filter']['items'].append({"name": name, "operator": operator, "value": value})
-            else:
-                self.params['filter'] = {"operator": boolean_operator, "items": [{"name": name, "operator": operator, "value": value}] + self.params['filter']['items']}
+            # Nest the existing group under the new operator instead of rebuilding its items
+            self.params['filter'] = {"operator": boolean_operator, "items": [group, item]}
         return self
 
     def set_filter(self, filter_group: Union[Dict, str]):
         """
         Sets the 'filter' parameter by accepting a dictionary or a JSON string.
 
+        The filter is stored as a dict either way (dicts are copied), like the groups
+        built by append_filter, and serialized once when the request is sent.
+
         Args:
             filter_group (Union[Dict, str]): Filter criteria as a dict or JSON string.
 
         Raises:
-            ValueError: If filter_group is a string but not valid JSON.
+            ValueError: If filter_group is a dict that can't be serialized to JSON,
+                or a string that isn't a valid JSON object.
             TypeError: If filter_group is neither a dict nor a string.
         """
         if isinstance(filter_group, dict):
+            # Round-trip through JSON: validates the dict and stores a copy, so append_filter
+            # doesn't modify the caller's dict and later changes to it aren't sent
             try:
-                self.params['filter'] = json.dumps(filter_group)
+                self.params['filter'] = _loads(_encode(filter_group))
             except (TypeError, ValueError) as e:
                 raise ValueError(f"filter_group dictionary must be serializable to JSON: {e}") from e
 
         elif isinstance(filter_group, str):
             # Validate that it's a valid JSON string representing a dict
             try:
-                parsed = json.loads(filter_group)
-                if not isinstance(parsed, dict):
-                    raise ValueError("filter_group JSON string must represent an object/dictionary.")
-                self.params['filter'] = filter_group  # Store the string as is
+                parsed = _loads(filter_group)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON string for filter_group: {e}") from e
+            if not isinstance(parsed, dict):
+                raise ValueError("filter_group JSON string must represent an object/dictionary.")
+            self.params['filter'] = parsed
 
         else:
             raise TypeError("filter_group must be a dict or a JSON-formatted string")
-        
+
         return self
 
     def order_by(self, name: str, direction: QueryOrder = "DESC"):
@@ -177,9 +432,13 @@ class ApiBaseQuery:
 
 
 class ApiModelQuery(ApiBaseQuery):
+    __slots__ = ("model", "_base_path", "_agg_path")
+
     def __init__(self, client: StofwareClient, model: str):
         super().__init__(client)
         self.model = model
+        self._base_path = f"models/{model}"
+        self._agg_path = f"aggregate/{model}"
 
     def select(self, fields: List[str]):
         self.params['select'] = fields
@@ -190,43 +449,151 @@ class ApiModelQuery(ApiBaseQuery):
         return self
 
     def get_single(self, id: Union[int, str]):
-        return self.client._request("GET", f"models/{self.model}/{id}", self.params)
+        return self.client._request("GET", f"{self._base_path}/{id}", self.params)
 
     def get_all(self):
-        return self.client._request("GET", f"models/{self.model}", self.params)
+        return self.client._request("GET", self._base_path, self.params)
+
+    def get_many(self, ids: List[Union[int, str]], select: Optional[List[str]] = None, page_limit: Optional[int] = None):
+        """
+        Fetches several records in a single request using an 'id IN ids' filter.
+        The filter is added to a copy of this query, which is left unchanged.
+
+        Args:
+            ids (List[Union[int, str]]): IDs of the records to fetch.
+            select (Optional[List[str]]): Fields to select.
+            page_limit (Optional[int]): Page limit, defaults to the number of ids.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        query = self._copy().filter("id", "IN", ids)
+        if select is not None:
+            query.select(select)
+        query.page_limit(page_limit or len(ids))
+        return query.get_all()
+
+    def get_many_concurrent(self, ids: List[Union[int, str]], chunk_size: int = 500, max_concurrency: int = 8):
+        """
+        Splits ids into chunks and fetches each chunk with get_many in parallel threads
+        sharing the client's session.
+
+        Returns:
+            List: One get_many response per chunk, in the order of ids.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self.get_many, self._chunk_ids(ids, chunk_size)))
+
+    def iter_pages(self, concurrency: int = 8, is_last_page: Optional[Callable[[Any], bool]] = None) -> Iterator[Any]:
+        """
+        Iterates over all pages of get_all, starting at the current page (or 1).
+
+        The first page is fetched on its own; the following pages are fetched in waves
+        of `concurrency` pages at a time over the shared session and yielded in order.
+        The sweep stops at the first empty page, or at the first page matched by
+        is_last_page. For list responses, by default a page shorter than page_limit
+        is the last one; other responses need is_last_page.
+
+        Args:
+            concurrency (int): Number of pages requested in parallel.
+            is_last_page (Optional[Callable[[Any], bool]]): Returns True for the last
+                page of the sweep. Required for responses that wrap their rows.
+
+        Raises:
+            TypeError: If a page is not a list and no is_last_page was given.
+        """
+        fetch = self._page_fetcher()
+
+        num = self.params.get('page', 1)
+        page = fetch(num)
+        is_last_page = self._last_page_predicate(page, is_last_page)
+        if not page:
+            return
+        yield page
+        if is_last_page(page):
+            return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                wave = range(num + 1, num + 1 + concurrency)
+                for page in executor.map(fetch, wave):
+                    if not page:
+                        return
+                    yield page
+                    if is_last_page(page):
+                        return
+                num = wave[-1]
+
+    def _page_fetcher(self) -> Callable[[int], Any]:
+        # Encode everything but the page once for the whole sweep
+        prefix = _encode_query({k: v for k, v in self.params.items() if k != 'page'})
+        prefix = f"{prefix}&" if prefix else ""
+
+        def fetch(num: int):
+            return self.client._request("GET", self._base_path, query=f"{prefix}page={int(num)}")
+
+        return fetch
+
+    def _last_page_predicate(self, page: Any, is_last_page: Optional[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+        if is_last_page is not None:
+            return is_last_page
+        if not isinstance(page, list):
+            raise TypeError("iter_pages needs is_last_page for responses that are not lists")
+        return self._is_short_page
+
+    def _is_short_page(self, page: Any) -> bool:
+        limit = self.params.get('page_limit')
+        return limit is not None and len(page) < limit
+
+    def _copy(self):
+        # get_many only appends to 'filters', the other values can be shared
+        query = type(self)(self.client, self.model)
+        query.params = dict(self.params)
+        if 'filters' in query.params:
+            query.params['filters'] = list(query.params['filters'])
+        return query
+
+    @staticmethod
+    def _chunk_ids(ids: List[Union[int, str]], chunk_size: int) -> List[List[Union[int, str]]]:
+        ids = list(ids)
+        return [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
 
     def aggregate(self, columns: List[Dict], extra_params: Optional[Dict] = None):
         self.params['columns'] = columns
         if extra_params:
             self.params.update(extra_params)
-        return self.client._request("GET", f"aggregate/{self.model}", self.params)
+        return self.client._request("GET", self._agg_path, self.params)
 
     def post(self, data: Dict):
-        return self.client._request("POST", f"models/{self.model}", None, data)
+        return self.client._request("POST", self._base_path, None, data)
 
     def put(self, id: Union[int, str], data: Dict):
-        return self.client._request("PUT", f"models/{self.model}/{id}", None, data)
+        return self.client._request("PUT", f"{self._base_path}/{id}", None, data)
 
     def bulk_put(self, data: Dict):
-        return self.client._request("PUT", f"models/{self.model}", None, data)
+        return self.client._request("PUT", self._base_path, None, data)
 
     def delete(self, id: Union[int, str]):
-        return self.client._request("DELETE", f"models/{self.model}/{id}")
+        return self.client._request("DELETE", f"{self._base_path}/{id}")
 
     def bulk_delete(self, data: Dict):
-        return self.client._request("DELETE", f"models/{self.model}", None, data)
+        return self.client._request("DELETE", self._base_path, None, data)
 
 
 class ApiViewQuery(ApiBaseQuery):
+    __slots__ = ("view_name", "_base_path", "_agg_path")
+
     def __init__(self, client: StofwareClient, view_name: str):
         super().__init__(client)
         self.view_name = view_name
+        self._base_path = f"views/{view_name}"
+        self._agg_path = f"views/{view_name}/aggregate"
 
     def get_all(self):
-        return self.client._request("GET", f"views/{self.view_name}", self.params)
+        return self.client._request("GET", self._base_path, self.params)
 
     def aggregate(self, columns: List[Dict], extra_params: Optional[Dict] = None):
         self.params['columns'] = columns
         if extra_params:
             self.params.update(extra_params)
-        return self.client._request("GET", f"views/{self.view_name}/aggregate", self.params)
+        return self.client._request("GET", self._agg_path, self.params)
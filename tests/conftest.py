@@ -0,0 +1,78 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+class RecordedRequest:
+    def __init__(self, method, path, headers, body):
+        url = urlparse(path)
+        self.method = method
+        self.path = url.path
+        self.query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.headers = headers
+        self.body = json.loads(body) if body else None
+
+    def param(self, name):
+        """Returns a query parameter, JSON-decoded when it holds a list or object."""
+        value = self.query[name]
+        return json.loads(value) if value[:1] in ("[", "{") else value
+
+
+class FakeApi:
+    """
+    Minimal HTTP server recording every request. `respond` maps a RecordedRequest
+    to (status, body, headers); by default every request gets 200 with {"ok": true}.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+        self.respond = lambda request: (200, {"ok": True}, {})
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_request(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length).decode() if length else None
+                request = RecordedRequest(self.command, self.path, dict(self.headers), body)
+                with api.lock:
+                    api.requests.append(request)
+                status, payload, headers = api.respond(request)
+                content = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    @property
+    def last(self):
+        return self.requests[-1]
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def api():
+    server = FakeApi()
+    yield server
+    server.close()
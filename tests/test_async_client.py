@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from stofware_client import AsyncStofwareClient
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_gather_fans_out_queries(api):
+    api.respond = lambda request: (200, {"path": request.path}, {})
+
+    async def main():
+        async with AsyncStofwareClient(api.url, "token") as client:
+            return await asyncio.gather(
+                client.model("users").get_all(),
+                client.model("orders").filter("status", "EQ", "open").get_all(),
+                client.view("totals").get_all(),
+            )
+
+    results = run(main())
+
+    assert results == [{"path": "/models/users"}, {"path": "/models/orders"}, {"path": "/views/totals"}]
+    assert all(r.headers["Authorization"] == "Bearer token" for r in api.requests)
+
+
+def test_redirects_are_followed(api):
+    api.respond = lambda request: (
+        (302, None, {"Location": "/models/people"}) if request.path == "/models/users" else (200, {"ok": True}, {})
+    )
+
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return await client.model("users").get_all()
+
+    assert run(main()) == {"ok": True}
+    assert [r.path for r in api.requests] == ["/models/users", "/models/people"]
+
+
+def test_errors_surface_on_await(api):
+    api.respond = lambda request: (404, {"detail": "missing"}, {})
+
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            pending = client.model("users").get_single(1)
+            with pytest.raises(Exception, match="404"):
+                await pending
+
+    run(main())
+
+
+def test_query_changes_after_call_are_not_sent(api):
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            query = client.model("users").page(1)
+            pending = query.get_all()
+            query.page(2)
+            await pending
+
+    run(main())
+
+    assert api.last.param("page") == "1"
+
+
+def test_server_errors_are_retried(api):
+    statuses = iter([503, 200])
+    api.respond = lambda request: (next(statuses), {"ok": True}, {})
+
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return await client.model("users").get_all()
+
+    assert run(main()) == {"ok": True}
+    assert len(api.requests) == 2
+
+
+def test_aclose_closes_the_http_client(api):
+    async def main():
+        client = AsyncStofwareClient(api.url)
+        await client.model("users").get_all()
+        await client.aclose()
+        return client
+
+    client = run(main())
+
+    assert client._client.is_closed
+
+
+def test_get_many_without_ids_is_awaitable(api):
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return await client.model("users").get_many([])
+
+    assert run(main()) == []
+    assert api.requests == []
+
+
+def test_get_many_concurrent_requests_each_chunk(api):
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return await client.model("users").get_many_concurrent(range(3), chunk_size=2)
+
+    assert len(run(main())) == 2
+    assert sorted(r.param("filters")[0]["value"] for r in api.requests) == [[0, 1], [2]]
+
+
+def test_iter_pages_stops_at_a_short_page(api):
+    rows = list(range(5))
+
+    def respond(request):
+        page = int(request.query["page"])
+        return 200, rows[(page - 1) * 2:page * 2], {}
+
+    api.respond = respond
+
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return [page async for page in client.model("users").page_limit(2).iter_pages(concurrency=2)]
+
+    assert run(main()) == [[0, 1], [2, 3], [4]]
+
+
+def test_iter_pages_requires_a_predicate_for_wrapped_pages(api):
+    api.respond = lambda request: (200, {"data": []}, {})
+
+    async def main():
+        async with AsyncStofwareClient(api.url) as client:
+            return [page async for page in client.model("users").iter_pages()]
+
+    with pytest.raises(TypeError):
+        run(main())
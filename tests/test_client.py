@@ -0,0 +1,329 @@
+import sys
+import time
+
+import pytest
+
+from stofware_client import StofwareClient
+
+
+def test_get_all_sends_params_as_json(api):
+    with StofwareClient(api.url, "token") as client:
+        client.model("users").filter("id", "IN", [1, 2]).order_by("name", "ASC").page(2).get_all()
+
+    request = api.last
+    assert request.method == "GET"
+    assert request.path == "/models/users"
+    assert request.param("filters") == [{"name": "id", "operator": "IN", "value": [1, 2]}]
+    assert request.param("order_by") == {"name": "name", "direction": "ASC"}
+    assert request.param("page") == "2"
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+def test_repeated_calls_send_the_same_query(api):
+    with StofwareClient(api.url) as client:
+        query = client.model("users").filter("id", "EQ", 1)
+        query.get_all()
+        query.get_all()
+
+    assert api.requests[0].query == api.requests[1].query
+
+
+def test_in_place_changes_to_filter_values_are_sent(api):
+    values = [1]
+    with StofwareClient(api.url) as client:
+        query = client.model("users").filter("id", "IN", values)
+        query.get_all()
+        values.append(2)
+        query.get_all()
+
+    assert api.last.param("filters")[0]["value"] == [1, 2]
+
+
+def test_direct_changes_to_params_are_sent(api):
+    with StofwareClient(api.url) as client:
+        query = client.model("users")
+        query.get_all()
+        query.params["select"] = ["a"]
+        query.get_all()
+
+    assert api.requests[0].query == {}
+    assert api.last.param("select") == ["a"]
+
+
+def test_page_changes_are_sent(api):
+    with StofwareClient(api.url) as client:
+        query = client.model("users").filter("id", "GT", 0)
+        query.page(1).get_all()
+        query.page(2).get_all()
+
+    assert [r.param("page") for r in api.requests] == ["1", "2"]
+    assert api.requests[0].param("filters") == api.requests[1].param("filters")
+
+
+def test_none_params_are_not_sent(api):
+    with StofwareClient(api.url) as client:
+        query = client.model("users").page(1)
+        query.params["search"] = None
+        query.get_all()
+
+    assert api.last.query == {"page": "1"}
+
+
+def test_get_many_leaves_the_query_unchanged(api):
+    with StofwareClient(api.url) as client:
+        query = client.model("users").filter("active", "EQ", True)
+        query.get_many([1, 2])
+        query.get_many([3])
+
+    filters = api.last.param("filters")
+    assert filters == [
+        {"name": "active", "operator": "EQ", "value": True},
+        {"name": "id", "operator": "IN", "value": [3]},
+    ]
+    assert api.last.param("page_limit") == "1"
+    assert query.params == {"filters": [{"name": "active", "operator": "EQ", "value": True}]}
+
+
+def test_get_many_without_ids_sends_nothing(api):
+    with StofwareClient(api.url) as client:
+        assert client.model("users").get_many([]) == []
+
+    assert api.requests == []
+
+
+def test_get_many_concurrent_requests_each_chunk(api):
+    with StofwareClient(api.url) as client:
+        client.model("users").get_many_concurrent(range(5), chunk_size=2)
+
+    chunks = sorted(r.param("filters")[0]["value"] for r in api.requests)
+    assert chunks == [[0, 1], [2, 3], [4]]
+
+
+def _etag_responder(request):
+    if request.headers.get("If-None-Match") == '"v1"':
+        return 304, None, {"ETag": '"v1"'}
+    return 200, {"path": request.path}, {"ETag": '"v1"'}
+
+
+def test_etag_cache_is_off_by_default(api):
+    api.respond = _etag_responder
+    with StofwareClient(api.url) as client:
+        client.model("users").get_all()
+        client.model("users").get_all()
+
+    assert all("If-None-Match" not in r.headers for r in api.requests)
+
+
+def test_not_modified_response_is_served_from_the_etag_cache(api):
+    api.respond = _etag_responder
+    with StofwareClient(api.url, etag_cache_size=2) as client:
+        first = client.model("users").get_all()
+        first["path"] = "changed by the caller"
+        second = client.model("users").get_all()
+
+    assert api.last.headers["If-None-Match"] == '"v1"'
+    assert second == {"path": "/models/users"}
+
+
+def test_etag_cache_evicts_the_least_recently_used_entry(api):
+    api.respond = _etag_responder
+    with StofwareClient(api.url, etag_cache_size=1) as client:
+        client.model("users").get_all()
+        client.model("orders").get_all()
+        client.model("users").get_all()
+
+    assert "If-None-Match" not in api.last.headers
+
+
+def _paged_responder(total_rows, wrap=False):
+    def respond(request):
+        page, limit = int(request.query["page"]), int(request.query.get("page_limit", 3))
+        rows = list(range(total_rows))[(page - 1) * limit:page * limit]
+        return 200, ({"data": rows, "page": page} if wrap else rows), {}
+    return respond
+
+
+def test_iter_pages_stops_at_a_short_page(api):
+    api.respond = _paged_responder(7)
+    with StofwareClient(api.url) as client:
+        pages = list(client.model("users").page_limit(3).iter_pages(concurrency=2))
+
+    assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_iter_pages_encodes_the_filter_once(api, monkeypatch):
+    import stofware_client.client as client_module
+
+    calls = []
+    encode = client_module._encode_query
+    monkeypatch.setattr(client_module, "_encode_query", lambda params: calls.append(params) or encode(params))
+    api.respond = _paged_responder(10)
+    with StofwareClient(api.url) as client:
+        list(client.model("users").filter("id", "GT", 0).page_limit(3).iter_pages(concurrency=2))
+
+    assert len(calls) == 1
+    assert {r.param("page") for r in api.requests} >= {"1", "2", "3", "4"}
+    assert all(r.param("filters") == [{"name": "id", "operator": "GT", "value": 0}] for r in api.requests)
+
+
+def test_iter_pages_requires_a_predicate_for_wrapped_pages(api):
+    api.respond = _paged_responder(7, wrap=True)
+    with StofwareClient(api.url) as client:
+        with pytest.raises(TypeError):
+            list(client.model("users").page_limit(3).iter_pages())
+
+        pages = list(client.model("users").page_limit(3).iter_pages(is_last_page=lambda p: len(p["data"]) < 3))
+
+    assert [p["data"] for p in pages] == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_append_filter_with_the_same_operator_extends_the_group(api):
+    with StofwareClient(api.url) as client:
+        client.model("users").append_filter("a", "EQ", 1).append_filter("b", "EQ", 2).get_all()
+
+    assert api.last.param("filter") == {
+        "operator": "AND",
+        "items": [{"name": "a", "operator": "EQ", "value": 1}, {"name": "b", "operator": "EQ", "value": 2}],
+    }
+
+
+def test_append_filter_with_another_operator_nests_the_group(api):
+    with StofwareClient(api.url) as client:
+        (client.model("users")
+            .append_filter("a", "EQ", 1)
+            .append_filter("b", "EQ", 2)
+            .append_filter("c", "EQ", 3, boolean_operator="OR")
+            .get_all())
+
+    assert api.last.param("filter") == {
+        "operator": "OR",
+        "items": [
+            {
+                "operator": "AND",
+                "items": [{"name": "a", "operator": "EQ", "value": 1}, {"name": "b", "operator": "EQ", "value": 2}],
+            },
+            {"name": "c", "operator": "EQ", "value": 3},
+        ],
+    }
+
+
+def test_set_filter_copies_the_callers_dict(api):
+    group = {"operator": "AND", "items": [{"name": "a", "operator": "EQ", "value": 1}]}
+    with StofwareClient(api.url) as client:
+        query = client.model("users").set_filter(group).append_filter("b", "EQ", 2)
+        group["items"][0]["value"] = 99
+        query.get_all()
+
+    assert len(group["items"]) == 1
+    assert api.last.param("filter")["items"] == [
+        {"name": "a", "operator": "EQ", "value": 1},
+        {"name": "b", "operator": "EQ", "value": 2},
+    ]
+
+
+def test_set_filter_rejects_json_that_is_not_an_object():
+    query = StofwareClient("http://localhost").model("users")
+    with pytest.raises(ValueError):
+        query.set_filter("[1]")
+    with pytest.raises(ValueError):
+        query.set_filter("{not json")
+
+
+def test_set_filter_rejects_a_dict_that_is_not_serializable():
+    query = StofwareClient("http://localhost").model("users")
+    with pytest.raises(ValueError, match="must be serializable to JSON"):
+        query.set_filter({"operator": "AND", "items": [object()]})
+    assert "filter" not in query.params
+
+
+def test_exhausted_retries_raise_the_status_and_body(api):
+    api.respond = lambda request: (503, {"detail": "down"}, {})
+    with StofwareClient(api.url) as client:
+        with pytest.raises(Exception, match='503: {"detail": "down"}'):
+            client.model("users").get_all()
+
+    assert len(api.requests) == 4
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Runs a test with orjson, when installed, and with the stdlib fallback."""
+    import importlib.util
+    import stofware_client.client as client_module
+
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location("_client_without_orjson", client_module.__file__)
+    fallback = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fallback)
+    for name in ("_encode", "_dumps", "_loads"):
+        monkeypatch.setattr(client_module, name, getattr(fallback, name))
+
+
+def test_non_str_keys_and_big_ints_are_encoded(api, json_backend):
+    with StofwareClient(api.url) as client:
+        client.model("users").bulk_put({1: {"name": "a"}, "big": 2 ** 70})
+        client.model("users").filter("id", "IN", [2 ** 70]).get_all()
+
+    assert api.requests[0].body == {"1": {"name": "a"}, "big": 2 ** 70}
+    assert api.last.param("filters")[0]["value"] == [2 ** 70]
+
+
+def test_httpx_transport_sends_and_clears_the_token(api):
+    pytest.importorskip("httpx")
+    with StofwareClient(api.url, "token", transport="httpx") as client:
+        client.model("users").get_all()
+        client.set_token(None)
+        client.model("users").get_all()
+
+    assert api.requests[0].headers["Authorization"] == "Bearer token"
+    assert "Authorization" not in api.requests[1].headers
+
+
+def test_httpx_transport_follows_redirects(api):
+    pytest.importorskip("httpx")
+    api.respond = lambda request: (
+        (302, None, {"Location": "/models/people"}) if request.path == "/models/users" else (200, {"ok": True}, {})
+    )
+    with StofwareClient(api.url, transport="httpx") as client:
+        assert client.model("users").get_all() == {"ok": True}
+
+    assert [r.path for r in api.requests] == ["/models/users", "/models/people"]
+
+
+def test_httpx_transport_retries_server_errors(api):
+    pytest.importorskip("httpx")
+    api.respond = lambda request: (503, None, {}) if len(api.requests) < 3 else (200, {"ok": True}, {})
+    with StofwareClient(api.url, transport="httpx") as client:
+        assert client.model("users").get_all() == {"ok": True}
+        api.respond = lambda request: (503, None, {})
+        with pytest.raises(Exception, match="503"):
+            client.model("users").post({"name": "a"})
+
+    assert len(api.requests) == 4
+
+
+def test_map_returns_results_in_order_and_raises_errors(api):
+    def respond(request):
+        number = int(request.path.rsplit("/", 1)[1])
+        time.sleep(0.05 * max(3 - number, 0))  # the first request finishes last
+        return (404, {"detail": "missing"}, {}) if number == 9 else (200, {"id": number}, {})
+
+    api.respond = respond
+    with StofwareClient(api.url) as client:
+        users = client.model("users")
+        assert client.map([lambda n=n: users.get_single(n) for n in range(3)]) == [{"id": 0}, {"id": 1}, {"id": 2}]
+        with pytest.raises(Exception, match="404"):
+            client.map([lambda: users.get_single(1), lambda: users.get_single(9)])
+
+
+def test_set_token_none_removes_the_authorization_header(api):
+    with StofwareClient(api.url, "token") as client:
+        client.model("users").get_all()
+        client.set_token(None)
+        client.model("users").get_all()
+
+    assert api.requests[0].headers["Authorization"] == "Bearer token"
+    assert "Authorization" not in api.requests[1].headers